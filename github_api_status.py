@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 
 import os
+import json
 import requests
 from datetime import datetime
 import time
 from dotenv import load_dotenv
 
+RATE_LIMIT_CACHE_FILE = 'rate_limit_cache.json'
+
 def get_rate_limits():
     """Get GitHub API rate limit information"""
     load_dotenv()
@@ -23,12 +26,37 @@ def get_rate_limits():
         # Get rate limit info
         response = requests.get('https://api.github.com/rate_limit', headers=headers)
         response.raise_for_status()
-        return response.json()
+        rate_limits = response.json()
+        save_cached_rate_limits(rate_limits)
+        return rate_limits
 
     except requests.exceptions.RequestException as e:
         print(f"Error accessing GitHub API: {e}")
         return None
 
+def save_cached_rate_limits(rate_limits):
+    """Store the latest rate limit response so it can be used offline"""
+    cached = dict(rate_limits, fetched_at=int(time.time()))
+    try:
+        with open(RATE_LIMIT_CACHE_FILE, 'w') as f:
+            json.dump(cached, f)
+    except OSError as e:
+        print(f"Warning: Unable to save rate limit cache to {RATE_LIMIT_CACHE_FILE}: {e}")
+
+def load_cached_rate_limits():
+    """Load the last stored rate limit response, refilling windows that have reset"""
+    try:
+        with open(RATE_LIMIT_CACHE_FILE, 'r') as f:
+            rate_limits = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    now = time.time()
+    for resource in rate_limits.get('resources', {}).values():
+        if resource['reset'] <= now:
+            resource['remaining'] = resource['limit']
+    return rate_limits
+
 def format_time_until_reset(reset_timestamp):
     """Format the time until rate limit reset"""
     now = datetime.now().timestamp()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+import argparse
+import math
+from colorama import init, Fore
+from dotenv import load_dotenv
+
+from github_accounts import get_top_accounts
+from github_api_status import get_rate_limits, load_cached_rate_limits, format_time_until_reset
+
+# Initialize colorama
+init(autoreset=True)
+
+# GitHub returns at most this many items per page, and get_newest_stars
+# only requests the first page
+STARS_PER_PAGE = 100
+
+def requests_per_account(stars_per_account, cache_hit_rate=0.0):
+    """Expected API requests needed to fetch the stars of one account"""
+    pages = 1 if stars_per_account > 0 else 0
+    return pages * (1 - cache_hit_rate)
+
+def fixed_requests(final_ranking, interactive=True, prefetch=5, cache_hit_rate=0.0):
+    """Expected API requests that do not depend on the number of accounts"""
+    # Interactive review fetches one README per displayed repository
+    if interactive and prefetch > 0:
+        return final_ranking * (1 - cache_hit_rate)
+    return 0
+
+def estimate_run(num_accounts, stars_per_account, core, final_ranking=100, interactive=True,
+                 prefetch=5, parallel=5, latency=0.5, cache_hit_rate=0.0, reserve=0.05):
+    """Estimate request count, quota usage and wall time for a proposed run"""
+    per_account = requests_per_account(stars_per_account, cache_hit_rate)
+    star_requests = math.ceil(num_accounts * per_account)
+    readme_requests = math.ceil(fixed_requests(final_ranking, interactive, prefetch, cache_hit_rate))
+    total_requests = star_requests + readme_requests
+
+    available = int(core['remaining'] * (1 - reserve))
+    fits = total_requests <= available
+
+    # The run does not wait for the reset: requests past the remaining quota
+    # get a 403 and those accounts or READMEs are silently skipped
+    starved_star_requests = max(0, star_requests - core['remaining'])
+    starved_readme_requests = max(0, readme_requests - max(0, core['remaining'] - star_requests))
+    accounts_starved = min(num_accounts, math.ceil(starved_star_requests / per_account)) if per_account > 0 else 0
+
+    # Star requests run in parallel; README requests overlap with user review
+    wall_time = math.ceil(star_requests / max(parallel, 1)) * latency
+
+    return {
+        "accounts": num_accounts,
+        "star_requests": star_requests,
+        "readme_requests": readme_requests,
+        "total_requests": total_requests,
+        "available": available,
+        "quota_usage": total_requests / core['limit'] if core['limit'] else 0,
+        "fits": fits,
+        "accounts_starved": accounts_starved,
+        "readme_requests_starved": starved_readme_requests,
+        "wall_time": wall_time,
+    }
+
+def max_accounts_within_quota(num_candidates, stars_per_account, core, final_ranking=100,
+                              interactive=True, prefetch=5, cache_hit_rate=0.0, reserve=0.05):
+    """Return the largest number of accounts whose run fits in the current window"""
+    available = int(core['remaining'] * (1 - reserve))
+    available -= math.ceil(fixed_requests(final_ranking, interactive, prefetch, cache_hit_rate))
+    per_account = requests_per_account(stars_per_account, cache_hit_rate)
+    if available <= 0:
+        return 0
+    if per_account <= 0:
+        return num_candidates
+    return min(num_candidates, int(available / per_account))
+
+def display_plan(estimate, core, stars_per_account, suggested_accounts, source):
+    """Display the estimated cost of a run and the largest run that fits"""
+    print(f"\n{Fore.CYAN}{'=' * 60}")
+    print(f"{Fore.YELLOW}Run Plan")
+    print(f"{Fore.CYAN}{'=' * 60}\n")
+
+    print(f"{Fore.CYAN}Rate limit source: {Fore.GREEN}{source}")
+    print(f"{Fore.CYAN}Core quota: {Fore.GREEN}{core['remaining']}/{core['limit']} "
+          f"{Fore.CYAN}(reset in {format_time_until_reset(core['reset'])})")
+    print(f"{Fore.CYAN}Usable after reserve: {Fore.GREEN}{estimate['available']}\n")
+
+    print(f"{Fore.CYAN}Accounts: {Fore.YELLOW}{estimate['accounts']}")
+    print(f"{Fore.CYAN}Star requests: {Fore.YELLOW}{estimate['star_requests']}")
+    if stars_per_account > STARS_PER_PAGE:
+        print(f"{Fore.YELLOW}  Note: only the first {STARS_PER_PAGE} stars per account are fetched")
+    print(f"{Fore.CYAN}README requests: {Fore.YELLOW}{estimate['readme_requests']}")
+    print(f"{Fore.CYAN}Total requests: {Fore.YELLOW}{estimate['total_requests']} "
+          f"{Fore.CYAN}({estimate['quota_usage'] * 100:.1f}% of the hourly limit)")
+    print(f"{Fore.CYAN}Estimated wall time: {Fore.YELLOW}{estimate['wall_time']:.0f} seconds\n")
+
+    if estimate['fits']:
+        print(f"{Fore.GREEN}This run fits in the current rate limit window.")
+    else:
+        print(f"{Fore.RED}This run does not fit in the current rate limit window.")
+        if estimate['accounts_starved'] or estimate['readme_requests_starved']:
+            print(f"{Fore.RED}About {estimate['accounts_starved']} accounts and "
+                  f"{estimate['readme_requests_starved']} README fetches would fail once the quota runs out.")
+    print(f"{Fore.CYAN}Largest account set that fits: {Fore.GREEN}--top-accounts {suggested_accounts}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estimate the API cost of a github_stars.py run")
+    parser.add_argument("--top-accounts", type=int, default=100, help="Number of top accounts to consider (default: 100)")
+    parser.add_argument("--stars-per-account", type=int, default=50, help="Number of newest stars to consider per account (default: 50)")
+    parser.add_argument("--final-ranking", type=int, default=100, help="Number of items to show in the final ranking (default: 100)")
+    parser.add_argument("--no-interactive", action="store_true", help="Plan for a run with interactive mode disabled")
+    parser.add_argument("--csv-file", type=str, default='github_following.csv',
+                      help="Path to the GitHub following CSV file (default: github_following.csv)")
+    parser.add_argument("--parallel", type=int, default=5,
+                      help="Number of parallel requests (default: 5)")
+    parser.add_argument("--prefetch", type=int, default=5,
+                      help="Number of upcoming repositories to prefetch details for in interactive mode (default: 5)")
+    parser.add_argument("--cached", action="store_true",
+                      help="Use the rate limit state stored by the last github_stars.py, "
+                           "github_api_status.py or planner run instead of querying the API")
+    parser.add_argument("--cache-hit-rate", type=float, default=0.0,
+                      help="Expected fraction of requests served without hitting the API (default: 0.0)")
+    parser.add_argument("--latency", type=float, default=0.5,
+                      help="Expected seconds per request (default: 0.5)")
+    parser.add_argument("--reserve", type=float, default=0.05,
+                      help="Fraction of the remaining quota to keep unused (default: 0.05)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if args.cached:
+        rate_limits = load_cached_rate_limits()
+        source = "cached"
+    else:
+        rate_limits = get_rate_limits()
+        source = "live"
+        if not rate_limits:
+            rate_limits = load_cached_rate_limits()
+            source = "cached (live query failed)"
+    if not rate_limits:
+        print(f"{Fore.RED}Error: No rate limit information available.")
+        exit(1)
+    core = rate_limits['resources']['core']
+
+    try:
+        # Load every account so the planner can suggest a larger set if it fits
+        candidates = get_top_accounts(args.csv_file, None)
+    except FileNotFoundError:
+        print(f"{Fore.RED}Error: {args.csv_file} not found.")
+        exit(1)
+    num_accounts = min(args.top_accounts, len(candidates))
+    interactive = not args.no_interactive
+
+    estimate = estimate_run(num_accounts, args.stars_per_account, core,
+                            final_ranking=args.final_ranking, interactive=interactive,
+                            prefetch=args.prefetch, parallel=args.parallel, latency=args.latency,
+                            cache_hit_rate=args.cache_hit_rate, reserve=args.reserve)
+    suggested_accounts = max_accounts_within_quota(len(candidates), args.stars_per_account, core,
+                                                   final_ranking=args.final_ranking, interactive=interactive,
+                                                   prefetch=args.prefetch, cache_hit_rate=args.cache_hit_rate,
+                                                   reserve=args.reserve)
+    display_plan(estimate, core, args.stars_per_account, suggested_accounts, source)
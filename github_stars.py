@@ -4,12 +4,14 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import json
-import csv
 import argparse
 import os
 import subprocess
 import concurrent.futures
-from collections import defaultdict, Counter
+import gzip
+import io
+import threading
+from collections import defaultdict, Counter, OrderedDict
 from requests.auth import HTTPBasicAuth
 from tqdm import tqdm
 import matplotlib.pyplot as plt
@@ -22,6 +24,9 @@ from datetime import datetime
 import os
 import pathlib
 import json
+from github_accounts import get_top_accounts
+from github_api_status import save_cached_rate_limits
+from github_run_planner import max_accounts_within_quota
 
 # Initialize colorama
 init(autoreset=True)
@@ -51,6 +56,8 @@ def check_rate_limit(token=None):
     headers = {'Authorization': f'token {token}'} if token else {}
     response = requests.get('https://api.github.com/rate_limit', headers=headers)
     if response.status_code == 200:
+        # Keep the cached state used by github_run_planner.py --cached current
+        save_cached_rate_limits(response.json())
         limits = response.json()['resources']['core']
         remaining = limits['remaining']
         reset_time = datetime.fromtimestamp(limits['reset']).strftime('%H:%M:%S')
@@ -118,23 +125,6 @@ def get_newest_stars(username, count, token):
     
     return stars
 
-def get_top_accounts(csv_file, n):
-    accounts = []
-    with open(csv_file, 'r') as f:
-        reader = csv.reader(f)
-        next(reader)  # Skip header
-        for row in reader:
-            try:
-                # Try old format (username, follower_count)
-                accounts.append((row[0], int(row[1])))
-            except ValueError:
-                # New format (username, repo_list)
-                # Use number of repos as the weight
-                repo_count = len(row[1].split(','))
-                accounts.append((row[0], repo_count))
-    
-    return sorted(accounts, key=lambda x: x[1], reverse=True)[:n]
-
 def process_account(args):
     username, count, token = args
     try:
@@ -201,8 +191,34 @@ def process_accounts(config_file, top_n, token, args):
     
     return all_stars, total_stars_considered, successful_requests, failed_requests
 
-def write_repo_data(sorted_repos, ignored_repos, timestamp=None):
-    """Write repository data to timestamped files in both human and machine readable formats"""
+def resolve_compression(compression):
+    """Return the compression mode that will actually be used, falling back to gzip without zstandard"""
+    if compression == 'none':
+        return None
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            print(f"{Fore.YELLOW}Warning: zstandard not installed. Falling back to gzip compression.")
+            return 'gzip'
+    return compression
+
+def open_data_stream(path, compression=None):
+    """Open a text stream for writing, optionally gzip or zstd compressed"""
+    if compression == 'gzip':
+        return gzip.open(f"{path}.gz", "wt", encoding="utf-8")
+    if compression == 'zstd':
+        import zstandard
+        raw = open(f"{path}.zst", "wb")
+        return io.TextIOWrapper(zstandard.ZstdCompressor().stream_writer(raw), encoding="utf-8")
+    return open(path, "w")
+
+def data_file_suffix(compression=None):
+    """Return the file suffix added by open_data_stream for a compression mode"""
+    return {'gzip': '.gz', 'zstd': '.zst'}.get(compression, '')
+
+def write_repo_data(sorted_repos, ignored_repos, timestamp=None, compression=None):
+    """Stream repository data to timestamped files in both human and machine readable formats"""
     if timestamp is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
@@ -213,40 +229,46 @@ def write_repo_data(sorted_repos, ignored_repos, timestamp=None):
     data_dir = pathlib.Path("data")
     data_dir.mkdir(exist_ok=True)
     
-    # Create the human-readable report file
     report_file = reports_dir / f"repo_report_{timestamp}.txt"
+    json_file = data_dir / f"repo_data_{timestamp}.jsonl"
     
-    with open(report_file, "w") as f:
-        f.write(f"Repository Report - Generated at {timestamp}\n")
-        f.write("=" * 80 + "\n\n")
+    # Write one record at a time instead of building a second copy of the
+    # ranking as a JSON document; the sorted ranking itself is still in memory
+    with open_data_stream(report_file, compression) as report, open_data_stream(json_file, compression) as data:
+        report.write(f"Repository Report - Generated at {timestamp}\n")
+        report.write("=" * 80 + "\n\n")
         
         for repo, usernames in sorted_repos:
             is_ignored = repo in ignored_repos
-            f.write(f"Repository: {repo}\n")
-            f.write(f"Stars: {len(usernames)}\n")
-            f.write(f"Status: {'Previously Displayed' if is_ignored else 'New'}\n")
-            f.write("Starred by:\n")
+            report.write(f"Repository: {repo}\n")
+            report.write(f"Stars: {len(usernames)}\n")
+            report.write(f"Status: {'Previously Displayed' if is_ignored else 'New'}\n")
+            report.write("Starred by:\n")
             for username in usernames:
-                f.write(f"  - {username}\n")
-            f.write("\n" + "-" * 40 + "\n\n")
-    
-    # Create the machine-readable JSON file
-    json_file = data_dir / f"repo_data_{timestamp}.json"
-    
-    json_data = {
-        "repositories": [
-            {
+                report.write(f"  - {username}\n")
+            report.write("\n" + "-" * 40 + "\n\n")
+            
+            record = {
                 "name": repo,
                 "stars_count": len(usernames),
-                "is_ignored": repo in ignored_repos,
+                "is_ignored": is_ignored,
                 "starred_by": usernames
             }
-            for repo, usernames in sorted_repos
-        ]
-    }
-    
-    with open(json_file, "w") as f:
-        json.dump(json_data, f, indent=2)
+            data.write(json.dumps(record, separators=(',', ':')) + "\n")
+
+def write_repo_data_async(all_stars, ignored_repos, timestamp=None, compression=None):
+    """Rank all repositories and stream them to disk on a background thread"""
+    def worker():
+        try:
+            all_sorted_repos = create_ranking(all_stars, None, ignored_repos)
+            write_repo_data(all_sorted_repos, ignored_repos, timestamp, compression)
+        except Exception as e:
+            print(f"{Fore.RED}Error writing repository report: {e}")
+    
+    # Not a daemon thread, so an interrupted review still leaves complete files
+    thread = threading.Thread(target=worker, name="repo-report-writer")
+    thread.start()
+    return thread
 
 def create_ranking(all_stars, top_repos, ignored_repos=None):
     if ignored_repos is None:
@@ -257,6 +279,7 @@ def create_ranking(all_stars, top_repos, ignored_repos=None):
         if repo_key not in ignored_repos:
             repo_counts[repo_key].append(username)
     
+    # top_repos=None keeps every repository
     sorted_repos = sorted(repo_counts.items(), key=lambda x: len(x[1]), reverse=True)[:top_repos]
     return sorted_repos
 
@@ -303,7 +326,135 @@ def display_distribution(all_stars, ignored_repos=None):
     plt.savefig('star_distribution.png')
     print(f"\n{Fore.CYAN}Distribution plot saved as 'star_distribution.png'")
 
-def display_ranking(sorted_repos, interactive=False, all_stars=None, initial_ignored=None):
+def build_repo_index(all_stars):
+    """Map each repository name to the first star payload seen for it"""
+    repo_index = {}
+    for star, _ in all_stars:
+        repo_key = f"{star['owner']['login']}/{star['name']}"
+        repo_index.setdefault(repo_key, star)
+    return repo_index
+
+def fetch_readme_excerpt(repo, token, max_chars=300):
+    """Fetch the README of a repository and return its first paragraph of prose"""
+    url = f"https://api.github.com/repos/{repo}/readme"
+    headers = {'Accept': 'application/vnd.github.raw'}
+    if token:
+        headers['Authorization'] = f'token {token}'
+    
+    session = create_session()
+    try:
+        response = session.get(url, headers=headers, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        if os.getenv('DEBUG'):
+            tqdm.write(f"{Fore.YELLOW}Unable to fetch README for {repo}: {e}")
+        return None
+    
+    # Skip headings, badges and HTML so the excerpt is the first real paragraph
+    paragraph = []
+    for line in response.text.splitlines():
+        line = line.strip()
+        if not line:
+            if paragraph:
+                break
+            continue
+        if line.startswith(('#', '<', '![', '[![', '```', '---', '===')):
+            if paragraph:
+                break
+            continue
+        paragraph.append(line)
+    
+    excerpt = ' '.join(paragraph)
+    if len(excerpt) > max_chars:
+        excerpt = excerpt[:max_chars].rstrip() + '...'
+    return excerpt or None
+
+class RepoDetailsCache:
+    """Thread-safe bounded LRU cache of repository detail futures"""
+    def __init__(self, max_size=128):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def get(self, repo):
+        with self.lock:
+            future = self.entries.get(repo)
+            if future is not None:
+                self.entries.move_to_end(repo)
+            return future
+    
+    def put(self, repo, future):
+        with self.lock:
+            self.entries[repo] = future
+            self.entries.move_to_end(repo)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+class RepoPrefetcher:
+    """Fetch README excerpts for upcoming repositories while the current one is reviewed"""
+    def __init__(self, all_stars, token, lookahead=5, cache_size=128, max_workers=2):
+        self.repo_index = build_repo_index(all_stars)
+        self.token = token
+        self.lookahead = lookahead
+        self.cache = RepoDetailsCache(max(cache_size, lookahead + 1))
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                              thread_name_prefix="repo-prefetch")
+    
+    def submit(self, repo):
+        # Description, language and star count come with the star payload,
+        # so only the README needs an extra request
+        future = self.cache.get(repo)
+        if future is None:
+            future = self.executor.submit(fetch_readme_excerpt, repo, self.token)
+            self.cache.put(repo, future)
+        return future
+    
+    def prefetch(self, upcoming_repos):
+        for repo in upcoming_repos[:self.lookahead]:
+            self.submit(repo)
+    
+    def get(self, repo, timeout=1.0):
+        """Return (ready, excerpt) for a repository, waiting at most timeout seconds"""
+        future = self.submit(repo)
+        try:
+            return True, future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            return False, None
+        except Exception as e:
+            if os.getenv('DEBUG'):
+                tqdm.write(f"{Fore.YELLOW}Unable to fetch README for {repo}: {e}")
+            return True, None
+    
+    def shutdown(self):
+        # Drop prefetches the user never reached instead of waiting for them
+        with self.cache.lock:
+            for future in self.cache.entries.values():
+                future.cancel()
+        self.executor.shutdown(wait=False)
+
+def display_repo_details(star):
+    """Print description, language and star count from a star payload"""
+    description = star.get('description')
+    language = star.get('language')
+    stargazers = star.get('stargazers_count')
+    
+    if description:
+        print(f"    {Fore.CYAN}Description: {Fore.WHITE}{description}")
+    if language or stargazers is not None:
+        print(f"    {Fore.CYAN}Language: {Fore.YELLOW}{language or 'n/a'}  "
+              f"{Fore.CYAN}Stars: {Fore.YELLOW}{stargazers if stargazers is not None else 'n/a'}")
+
+def display_readme_excerpt(prefetcher, repo):
+    """Print the README excerpt for a repository without blocking on a slow fetch"""
+    ready, excerpt = prefetcher.get(repo)
+    if not ready:
+        print(f"    {Fore.CYAN}README: {Fore.YELLOW}loading...")
+    elif excerpt:
+        print(f"    {Fore.CYAN}README: {Fore.WHITE}{excerpt}")
+    else:
+        print(f"    {Fore.CYAN}README: {Fore.YELLOW}unavailable")
+
+def display_ranking(sorted_repos, interactive=False, all_stars=None, initial_ignored=None, prefetcher=None):
     # Create browser_opens.log if it doesn't exist
     if not os.path.exists('browser_opens.log'):
         with open('browser_opens.log', 'w') as f:
@@ -314,11 +465,23 @@ def display_ranking(sorted_repos, interactive=False, all_stars=None, initial_ign
     print(f"{Fore.YELLOW}Repository Ranking (Most Popular at Top)")
     print(f"{Fore.CYAN}{'=' * 60}\n")
     
+    repo_index = prefetcher.repo_index if prefetcher else build_repo_index(all_stars)
+    repo_names = [repo for repo, _ in sorted_repos]
+    
     for i, (repo, usernames) in enumerate(sorted_repos, 1):
+        # Start fetching this repo and the next few while the user reads
+        if interactive and prefetcher:
+            prefetcher.submit(repo)
+            prefetcher.prefetch(repo_names[i:])
+        
         status = "[PREV]" if repo in initial_ignored else ""
         print(f"{Fore.MAGENTA}{i:3}. {status} {Fore.GREEN}{repo}")
-        repo_url = next(star['html_url'] for star, _ in all_stars if f"{star['owner']['login']}/{star['name']}" == repo)
+        star = repo_index[repo]
+        repo_url = star['html_url']
         print(f"    {Fore.CYAN}URL: {Fore.BLUE}{repo_url}")
+        display_repo_details(star)
+        if interactive and prefetcher:
+            display_readme_excerpt(prefetcher, repo)
         print(f"    {Fore.CYAN}Starred by {Fore.YELLOW}{len(usernames)} {Fore.CYAN}account(s):")
         print(f"    {Fore.YELLOW}{', '.join(usernames)}")
         print()
@@ -341,7 +504,7 @@ def display_ranking(sorted_repos, interactive=False, all_stars=None, initial_ign
             add_to_ignored_repos(repo)
             
             # Check for changes to ignored repos after each repo
-            new_ignored = recheck_and_display(all_stars, args, initial_ignored)
+            new_ignored = recheck_and_display(all_stars, args, initial_ignored, prefetcher)
             if new_ignored:
                 initial_ignored = new_ignored
 
@@ -359,7 +522,7 @@ class IgnoreFileHandler(FileSystemEventHandler):
         # This will be called only for external modifications
         pass
 
-def recheck_and_display(all_stars, args, initial_ignored):
+def recheck_and_display(all_stars, args, initial_ignored, prefetcher=None):
     """Recheck ignored repos and redisplay if changed"""
     current_ignored = load_ignored_repos()
     
@@ -385,7 +548,8 @@ def recheck_and_display(all_stars, args, initial_ignored):
         sorted_repos = create_ranking(all_stars, args.final_ranking, current_ignored)
         print("\n" + "=" * 80 + "\n")
         print(f"{Fore.CYAN}Refreshed repository ranking:")
-        display_ranking(sorted_repos, interactive=not args.no_interactive, all_stars=all_stars, initial_ignored=current_ignored)
+        display_ranking(sorted_repos, interactive=not args.no_interactive, all_stars=all_stars,
+                        initial_ignored=current_ignored, prefetcher=prefetcher)
         
     return current_ignored
 
@@ -414,6 +578,12 @@ if __name__ == "__main__":
                       help="Save the top N repositories to a file")
     parser.add_argument("--output-file", type=str, default="top_repos.txt",
                       help="Filename to save top repositories (default: top_repos.txt)")
+    parser.add_argument("--prefetch", type=int, default=5,
+                      help="Number of upcoming repositories to prefetch README excerpts for in interactive mode (default: 5)")
+    parser.add_argument("--cache-size", type=int, default=128,
+                      help="Maximum number of README excerpts kept in the prefetch cache (default: 128)")
+    parser.add_argument("--compress", choices=["none", "gzip", "zstd"], default="none",
+                      help="Compression for report and data files (default: none)")
     args = parser.parse_args()
 
     config = load_config()
@@ -432,6 +602,17 @@ if __name__ == "__main__":
         print(f"{Fore.GREEN}Remaining: {remaining}/{total} requests")
         print(f"{Fore.YELLOW}Used: {used} requests")
         print(f"{Fore.CYAN}Reset Time: {reset_time}\n")
+        
+        # Warn before starting a run that would run out of quota halfway
+        core = {'remaining': remaining, 'limit': total}
+        fitting_accounts = max_accounts_within_quota(args.top_accounts, args.stars_per_account, core,
+                                                     final_ranking=args.final_ranking,
+                                                     interactive=not args.no_interactive,
+                                                     prefetch=args.prefetch)
+        if fitting_accounts < args.top_accounts:
+            print(f"{Fore.RED}Warning: --top-accounts {args.top_accounts} may exceed the remaining quota. "
+                  f"Only about {fitting_accounts} accounts fit before {reset_time}.")
+            print(f"{Fore.YELLOW}Run github_run_planner.py for a detailed estimate.\n")
     
     initial_ignored = load_ignored_repos()
     if initial_ignored:
@@ -450,12 +631,13 @@ if __name__ == "__main__":
     # Generate timestamp for this run
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Write all repository data before displaying
-    all_sorted_repos = create_ranking(all_stars, len(all_stars), initial_ignored)  # Get all repos
-    write_repo_data(all_sorted_repos, initial_ignored, timestamp)
-    print(f"\n{Fore.CYAN}Report saved to:")
-    print(f"{Fore.GREEN}  - reports/repo_report_{timestamp}.txt (human readable)")
-    print(f"{Fore.GREEN}  - data/repo_data_{timestamp}.json (machine readable)")
+    # Write all repository data in the background while the ranking is displayed
+    compression = resolve_compression(args.compress)
+    suffix = data_file_suffix(compression)
+    report_writer = write_repo_data_async(all_stars, initial_ignored, timestamp, compression)
+    print(f"\n{Fore.CYAN}Writing report in the background to:")
+    print(f"{Fore.GREEN}  - reports/repo_report_{timestamp}.txt{suffix} (human readable)")
+    print(f"{Fore.GREEN}  - data/repo_data_{timestamp}.jsonl{suffix} (machine readable, JSON Lines)")
     
     # Save top N repos if requested
     if args.save_top is not None:
@@ -467,7 +649,20 @@ if __name__ == "__main__":
                 f.write(f"   URL: {repo_url}\n")
         print(f"\n{Fore.GREEN}Saved top {top_n} repositories to {args.output_file}")
 
-    display_ranking(sorted_repos, interactive=not args.no_interactive, all_stars=all_stars, initial_ignored=initial_ignored)
+    prefetcher = None
+    if not args.no_interactive and args.prefetch > 0:
+        prefetcher = RepoPrefetcher(all_stars, token, lookahead=args.prefetch,
+                                    cache_size=args.cache_size, max_workers=min(args.prefetch, args.parallel))
+    
+    try:
+        display_ranking(sorted_repos, interactive=not args.no_interactive, all_stars=all_stars,
+                        initial_ignored=initial_ignored, prefetcher=prefetcher)
+    finally:
+        if prefetcher:
+            prefetcher.shutdown()
+        
+        # Make sure the background report is fully flushed, even after Ctrl-C
+        report_writer.join()
 
     # Show final statistics
     print(f"\n{Fore.CYAN}{'=' * 60}")